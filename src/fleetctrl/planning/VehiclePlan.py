@@ -7,7 +7,7 @@ import logging
 # ------------------------------------------
 import numpy as np
 from abc import abstractmethod, ABCMeta
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Any
 
 # src imports
 # -----------
@@ -41,6 +41,7 @@ class PlanStopBase(metaclass=ABCMeta):
     a vehicle plan thereby consists of an temporal ordered list of PlanStops which are performed one after another
     vehicles are moving between these different plan stops.
     """
+    __slots__ = ()
     
     @abstractmethod
     def get_pos(self) -> tuple:
@@ -216,6 +217,14 @@ class PlanStop(PlanStopBase):
         a vehicle plan thereby consists of an temporal ordered list of PlanStops which are performed one after another
         vehicles are moving between these different plan stops.
         this class is the most general class of plan stops"""
+    # plan stops are created and copied in large numbers during the assignment -> no instance __dict__
+    __slots__ = ("pos", "state", "boarding_dict", "locked", "locked_end", "fixed_stop", "charging_power",
+                 "change_nr_pax", "change_nr_parcels", "max_trip_time_dict", "latest_arrival_time_dict",
+                 "earliest_pickup_time_dict", "latest_pickup_time_dict", "direct_earliest_start_time",
+                 "direct_latest_start_time", "direct_duration", "direct_earliest_end_time", "_latest_start_time",
+                 "_earliest_start_time", "_planned_arrival_time", "_planned_departure_time", "_planned_arrival_soc",
+                 "_planned_departure_soc", "started_at", "infeasible_locked", "charging_task_id")
+
     def __init__(self, position, boarding_dict={}, max_trip_time_dict={}, latest_arrival_time_dict={}, earliest_pickup_time_dict={}, latest_pickup_time_dict={},
                  change_nr_pax=0, change_nr_parcels=0, earliest_start_time=None, latest_start_time=None, duration=None, earliest_end_time=None,
                  locked=False, locked_end=False, charging_power=0, planstop_state : G_PLANSTOP_STATES=G_PLANSTOP_STATES.MIXED,
@@ -480,6 +489,8 @@ class PlanStop(PlanStopBase):
 
 class BoardingPlanStop(PlanStop):
     """ this class can be used to generate a plan stop where only boarding processes take place """
+    __slots__ = ()
+
     def __init__(self, position, boarding_dict={}, max_trip_time_dict={}, latest_arrival_time_dict={},
                  earliest_pickup_time_dict={}, latest_pickup_time_dict={}, change_nr_pax=0, change_nr_parcels=0,
                  duration=None, locked=False,
@@ -506,6 +517,8 @@ class BoardingPlanStop(PlanStop):
 class RoutingTargetPlanStop(PlanStop):
     """ this plan stop can be used to schedule a routing target for vehicles with the only task to drive there
         i.e repositioning"""
+    __slots__ = ()
+
     def __init__(self, position, earliest_start_time=None, latest_start_time=None, duration=None, earliest_end_time=None, locked=False, locked_end=False, planstop_state=G_PLANSTOP_STATES.REPO_TARGET):
         """
         :param position: network position (3 tuple) of the position this PlanStops takes place (target for routing)
@@ -523,6 +536,8 @@ class RoutingTargetPlanStop(PlanStop):
 
 class ChargingPlanStop(PlanStop):
     """ this plan stop can be used to schedule a charging only process """
+    __slots__ = ()
+
     def __init__(self, position, earliest_start_time=None, latest_start_time=None, duration=None, 
                  earliest_end_time=None, locked=False, locked_end=False, charging_power=0,
                  charging_task_id: Tuple[int, str] = None, status: Optional[VRL_STATES] = None):
@@ -547,6 +562,14 @@ class VehiclePlan:
     a Vehicle mainly consists of two parts:
         - a vehicle this plan is assigned to, and therefore the current state of the vehicle
         - an ordered list of PlanStops defining the tasks the vehicle is supposed to perform (vehicles move from one plan stop to another)"""
+    # values cached for the plan stops (see __init__); reset in _check_cached_values if list_plan_stops is changed
+    _PLAN_STOP_CACHE_ATTRIBUTES = ("cached_end_time", "_sum_veh_wait")
+    # route values cached for the plan stops; additionally reset in _set_route_state if vehicle position or network change
+    _ROUTE_CACHE_ATTRIBUTES = ("_route_start_pos", "_route_network_id", "_route_tt_version", "_sum_route_distance",
+                               "_sum_route_distance_excl_locked_end", "_sum_route_tt", "_end_time_no_repo")
+    # values cached for pax_info; kept if only list_plan_stops is changed, as pax_info is only rebuilt with the plan
+    _PAX_INFO_CACHE_ATTRIBUTES = ("_sum_user_times", "_sum_detour_times")
+
     def __init__(self, veh_obj : SimulationVehicle, sim_time : float, routing_engine : NetworkBase, list_plan_stops : List[PlanStopBase], copy: bool =False, external_pax_info : dict = {}):
         """
         :param veh_obj: corresponding simulation vehicle reference
@@ -566,6 +589,30 @@ class VehiclePlan:
         self.vid = None
         self.feasible = None
         self.structural_feasible = True  # indicates if plan is in line with vehicle state ignoring time constraints
+        # plan stops the following route values refer to (if list_plan_stops is changed without updating the plan,
+        # the values are reset in _check_cached_values)
+        self._cached_plan_stops = None
+        # planned arrival time at last plan stop (set in update_tt_and_check_plan; None if no plan stops)
+        self.cached_end_time = None
+        # driven distance and travel time of the plan starting at _route_start_pos
+        # (set in update_tt_and_check_plan or by objective functions; None if not available)
+        # _sum_route_distance_excl_locked_end only sums up distance until the first locked_end plan stop
+        self._route_start_pos = None
+        # id and travel time version (see NetworkBase.travel_time_version) of the routing engine used for route values
+        self._route_network_id = None
+        self._route_tt_version = None
+        self._sum_route_distance = None
+        self._sum_route_distance_excl_locked_end = None
+        self._sum_route_tt = None
+        # sum of stop times (departure - arrival) at plan stops (set in update_tt_and_check_plan; None if not available)
+        self._sum_veh_wait = None
+        # sum of (drop off time - request time) of all requests in pax_info (set by objective functions; reset on plan updates)
+        self._sum_user_times = None
+        # sum of (drop off time - pick up time - direct travel time) of all requests in pax_info (same as above)
+        self._sum_detour_times = None
+        # arrival time at a locked_end plan stop at the end of the plan without waiting time before
+        # (set by objective functions; same route state as above)
+        self._end_time_no_repo = None
         if not copy:
             self.vid = veh_obj.vid
             self.feasible = self.update_tt_and_check_plan(veh_obj, sim_time, routing_engine, keep_feasible=True)
@@ -584,8 +631,73 @@ class VehiclePlan:
         tmp_VehiclePlan.utility = self.utility
         tmp_VehiclePlan.pax_info = self.pax_info.copy()
         tmp_VehiclePlan.feasible = True
+        self._copy_cached_values(tmp_VehiclePlan)
         return tmp_VehiclePlan
 
+    def _copy_cached_values(self, other_plan):
+        """ copies the values cached during update_tt_and_check_plan to another plan (used when copying plans)
+        :param other_plan: vehicle plan copy (with copies of the plan stops of this plan)"""
+        self._check_cached_values()
+        other_plan._cached_plan_stops = other_plan.list_plan_stops.copy()
+        for attribute in self._PLAN_STOP_CACHE_ATTRIBUTES + self._ROUTE_CACHE_ATTRIBUTES + self._PAX_INFO_CACHE_ATTRIBUTES:
+            setattr(other_plan, attribute, getattr(self, attribute))
+
+    def _reset_cached_values(self):
+        """ resets the values cached during update_tt_and_check_plan (i.e. if plan stops are changed) """
+        self._cached_plan_stops = None
+        for attribute in self._PLAN_STOP_CACHE_ATTRIBUTES + self._ROUTE_CACHE_ATTRIBUTES + self._PAX_INFO_CACHE_ATTRIBUTES:
+            setattr(self, attribute, None)
+
+    def _check_cached_values(self):
+        """ resets the route values cached for the plan stops if list_plan_stops has been changed since they were
+        computed (i.e. plan stops are added to or removed from a plan copy without updating it); afterwards, cached
+        values refer to the current plan stops """
+        if self._cached_plan_stops != self.list_plan_stops:
+            for attribute in self._PLAN_STOP_CACHE_ATTRIBUTES + self._ROUTE_CACHE_ATTRIBUTES:
+                setattr(self, attribute, None)
+            self._cached_plan_stops = self.list_plan_stops.copy()
+
+    def _sum_route_costs(self, start_pos : tuple, routing_engine : NetworkBase, cost_index : int, ignore_locked_end : bool=False) -> float:
+        """ sums up a travel cost metric along the route of the plan by querying the routing engine
+        :param start_pos: position the route starts from
+        :param routing_engine: routing engine reference
+        :param cost_index: index of the metric in the return tuple of routing_engine.return_travel_costs_1to1()
+            (0: cost, 1: travel time, 2: distance)
+        :param ignore_locked_end: if True, the costs are only summed up until the first locked_end plan stop
+        :return: sum of the travel cost metric"""
+        return_travel_costs_1to1 = routing_engine.return_travel_costs_1to1
+        sum_costs = 0
+        last_pos = start_pos
+        for ps in self.list_plan_stops:
+            if ignore_locked_end and ps.locked_end:
+                break
+            pos = ps.pos
+            if pos != last_pos:
+                sum_costs += return_travel_costs_1to1(last_pos, pos)[cost_index]
+                last_pos = pos
+        return sum_costs
+
+    def _is_current_route_state(self, veh_obj : SimulationVehicle, routing_engine : NetworkBase) -> bool:
+        """ checks if the cached route values were computed from the current vehicle position with the current travel
+        times of the routing engine
+        :param veh_obj: simulation vehicle object
+        :param routing_engine: routing engine reference
+        :return: True, if cached route values can be used"""
+        return self._route_start_pos == veh_obj.pos and self._route_network_id == id(routing_engine) \
+            and self._route_tt_version == routing_engine.travel_time_version
+
+    def _set_route_state(self, veh_obj : SimulationVehicle, routing_engine : NetworkBase):
+        """ prepares the plan to store route values computed from the current vehicle position with the current travel
+        times of the routing engine; route values cached for another route state are reset
+        :param veh_obj: simulation vehicle object
+        :param routing_engine: routing engine reference"""
+        if not self._is_current_route_state(veh_obj, routing_engine):
+            for attribute in self._ROUTE_CACHE_ATTRIBUTES:
+                setattr(self, attribute, None)
+            self._route_start_pos = veh_obj.pos
+            self._route_network_id = id(routing_engine)
+            self._route_tt_version = routing_engine.travel_time_version
+
     def is_feasible(self) -> bool:
         """ this method can be used to check of plan is feasible
         :return: (bool) True if feasible"""
@@ -617,6 +729,113 @@ class VehiclePlan:
         :return: utility value (cost function value) or None"""
         return self.utility
 
+    def get_route_distance(self, veh_obj : SimulationVehicle, routing_engine : NetworkBase, ignore_locked_end : bool=False) -> float:
+        """ returns the distance driven by the vehicle to complete the plan; the value computed in update_tt_and_check_plan
+        is used if available, otherwise the routing engine is queried and the result is stored in the plan
+        :param veh_obj: simulation vehicle object
+        :param routing_engine: routing engine reference
+        :param ignore_locked_end: if True, the distance is only summed up until the first locked_end plan stop
+        :return: driven distance"""
+        self._check_cached_values()
+        if self._is_current_route_state(veh_obj, routing_engine):
+            if ignore_locked_end:
+                sum_dist = self._sum_route_distance_excl_locked_end
+            else:
+                sum_dist = self._sum_route_distance
+            if sum_dist is not None:
+                return sum_dist
+        sum_dist = self._sum_route_costs(veh_obj.pos, routing_engine, 2, ignore_locked_end=ignore_locked_end)
+        self._set_route_state(veh_obj, routing_engine)
+        if ignore_locked_end:
+            self._sum_route_distance_excl_locked_end = sum_dist
+        else:
+            self._sum_route_distance = sum_dist
+        return sum_dist
+
+    def get_route_travel_time(self, veh_obj : SimulationVehicle, routing_engine : NetworkBase) -> float:
+        """ returns the driving time (without boarding and waiting) of the vehicle to complete the plan; the value computed
+        in update_tt_and_check_plan is used if available, otherwise the routing engine is queried and the result is stored
+        :param veh_obj: simulation vehicle object
+        :param routing_engine: routing engine reference
+        :return: driving time"""
+        self._check_cached_values()
+        if self._is_current_route_state(veh_obj, routing_engine) and self._sum_route_tt is not None:
+            return self._sum_route_tt
+        sum_tt = self._sum_route_costs(veh_obj.pos, routing_engine, 1)
+        self._set_route_state(veh_obj, routing_engine)
+        self._sum_route_tt = sum_tt
+        return sum_tt
+
+    def get_end_time(self, sim_time : float) -> float:
+        """ returns the planned arrival time at the last plan stop
+        :param sim_time: current simulation time (returned for empty plans)
+        :return: planned end time of the plan"""
+        self._check_cached_values()
+        end_time = self.cached_end_time
+        if end_time is None:
+            if not self.list_plan_stops:
+                return sim_time
+            end_time = self.list_plan_stops[-1].get_planned_arrival_and_departure_time()[0]
+        return end_time
+
+    def get_end_time_no_repo(self, veh_obj : SimulationVehicle, routing_engine : NetworkBase) -> float:
+        """ returns the arrival time at the last plan stop if the vehicle drives there directly from the previous plan stop,
+        i.e. without waiting time before a locked_end plan stop (repositioning or reservation) at the end of the plan
+        :param veh_obj: simulation vehicle object
+        :param routing_engine: routing engine reference
+        :return: arrival time at last plan stop (the plan requires at least two plan stops)"""
+        self._check_cached_values()
+        if self._is_current_route_state(veh_obj, routing_engine) and self._end_time_no_repo is not None:
+            return self._end_time_no_repo
+        prev_ps = self.list_plan_stops[-2]
+        prev_end_time = prev_ps.get_planned_arrival_and_departure_time()[0]
+        end_time = prev_end_time + routing_engine.return_travel_costs_1to1(prev_ps.get_pos(), self.list_plan_stops[-1].get_pos())[1]
+        self._set_route_state(veh_obj, routing_engine)
+        self._end_time_no_repo = end_time
+        return end_time
+
+    def get_sum_veh_wait(self) -> Optional[float]:
+        """ returns the sum of planned stop times (departure - arrival) of the vehicle at the plan stops
+        :return: sum of stop times; None if the plan is not planned through (arrival time missing)"""
+        self._check_cached_values()
+        sum_veh_wait = self._sum_veh_wait
+        if sum_veh_wait is None:
+            sum_veh_wait = 0
+            for ps in self.list_plan_stops:
+                arrival_time, departure_time = ps.get_planned_arrival_and_departure_time()
+                if arrival_time is None:
+                    return None
+                # compute vehicle stop time if departure is already planned
+                if departure_time is not None:
+                    veh_wait_time = departure_time - arrival_time
+                    if veh_wait_time > 0:
+                        sum_veh_wait += veh_wait_time
+        return sum_veh_wait
+
+    def get_sum_user_times(self, rq_dict : Dict[Any, PlanRequest]) -> float:
+        """ returns the sum of user times (request time till drop off) of all requests in pax_info
+        :param rq_dict: rid -> plan request dictionary
+        :return: sum of user times"""
+        sum_user_times = self._sum_user_times
+        if sum_user_times is None:
+            sum_user_times = 0
+            for rid, boarding_info_list in self.pax_info.items():
+                sum_user_times += boarding_info_list[1] - rq_dict[rid].rq_time
+            self._sum_user_times = sum_user_times
+        return sum_user_times
+
+    def get_sum_detour_times(self, rq_dict : Dict[Any, PlanRequest]) -> float:
+        """ returns the sum of detour times (in-vehicle time exceeding the direct travel time) of all requests in pax_info
+        :param rq_dict: rid -> plan request dictionary
+        :return: sum of detour times"""
+        sum_detour_times = self._sum_detour_times
+        if sum_detour_times is None:
+            sum_detour_times = 0
+            for rid, boarding_info_list in self.pax_info.items():
+                sum_detour_times += boarding_info_list[1] - boarding_info_list[0] - rq_dict[rid].init_direct_tt
+            self._sum_detour_times = sum_detour_times
+        return sum_detour_times
+
     def add_plan_stop(self, plan_stop : PlanStopBase, veh_obj : SimulationVehicle, sim_time : float, routing_engine : NetworkBase, return_copy : bool=False, position : tuple=None):
         """This method adds a plan stop to an existing vehicle plan. After that, it updates the plan.
 
@@ -712,6 +931,7 @@ class VehiclePlan:
                         return False
                     # remove stop from plan
                     self.list_plan_stops = self.list_plan_stops[1:]
+                    self._reset_cached_values()
                 else:
                     # plan infeasible as soon as anybody boarded or alighted the vehicle
                     if vrl.rq_dict.get(1) or vrl.rq_dict.get(-1):
@@ -777,12 +997,20 @@ class VehiclePlan:
             c_pax = init_plan_state["c_pax"].copy()
             nr_pax = init_plan_state["c_nr_pax"]
             nr_parcels = init_plan_state["c_nr_parcels"]
+            c_dist = init_plan_state["c_dist"]
+            c_dist_excl_le = init_plan_state["c_dist_excl_le"]
+            c_tt = init_plan_state["c_tt"]
+            c_veh_wait = init_plan_state["c_veh_wait"]
             self.pax_info = {}
             for k, v in init_plan_state["pax_info"].items():
                 self.pax_info[k] = v.copy()
         else:
             start_stop_index = 0
             c_pos = veh_obj.pos
+            c_dist = 0
+            c_dist_excl_le = None
+            c_tt = 0
+            c_veh_wait = 0
             c_soc = veh_obj.soc
             c_time = sim_time
             if self.list_plan_stops[0].is_locked():  # set time at start_time of boarding process
@@ -797,12 +1025,18 @@ class VehiclePlan:
             for rq in veh_obj.pax:
                 rid = key_translator.get(rq.get_rid_struct(), rq.get_rid_struct())
                 self.pax_info[rid] = [rq.pu_time]
+        # pax_info and planned times of the plan stops are changed
+        self._reset_cached_values()
         # for pstop in self.list_plan_stops[:stop_index + 1]:
         for i, pstop in enumerate(self.list_plan_stops[start_stop_index:stop_index + 1]):
+            if c_dist_excl_le is None and pstop.is_locked_end():
+                c_dist_excl_le = c_dist
             if c_pos != pstop.get_pos():
                 _, tt, tdist = routing_engine.return_travel_costs_1to1(c_pos, pstop.get_pos())
                 c_pos = pstop.get_pos()
                 c_time += tt
+                c_dist += tdist
+                c_tt += tt
                 c_soc -= veh_obj.compute_soc_consumption(tdist)
             if c_pos == pstop.get_pos():
                 last_c_time = c_time
@@ -830,6 +1064,8 @@ class VehiclePlan:
                 # set departure time
                 c_time = pstop.get_departure_time(c_time)
                 pstop.set_planned_arrival_and_departure_time(last_c_time, c_time)
+                if c_time > last_c_time:
+                    c_veh_wait += c_time - last_c_time
                 # set charge
                 if pstop.get_charging_power() > 0:  # TODO # is charging now in waiting included as planned here?
                     c_soc += veh_obj.compute_soc_charging(pstop.get_charging_power(), c_time - last_c_time)
@@ -837,7 +1073,9 @@ class VehiclePlan:
                 pstop.set_planned_arrival_and_departure_soc(last_c_soc, c_soc)
                     
         return {"stop_index": stop_index, "c_pos": c_pos, "c_soc": c_soc, "c_time": c_time, "c_pax": c_pax,
-                "pax_info": self.pax_info.copy(), "c_nr_pax": nr_pax, "c_nr_parcels" : nr_parcels}
+                "pax_info": self.pax_info.copy(), "c_nr_pax": nr_pax, "c_nr_parcels" : nr_parcels,
+                "c_dist": c_dist, "c_dist_excl_le": c_dist_excl_le, "c_tt": c_tt,
+                "c_veh_wait": c_veh_wait}
 
     def update_tt_and_check_plan(self, veh_obj : SimulationVehicle, sim_time : float, routing_engine : NetworkBase, init_plan_state : dict=None, keep_feasible : bool=False):
         """This method updates the planning properties of all PlanStops of the Plan according to the new vehicle
@@ -853,6 +1091,7 @@ class VehiclePlan:
         # TODO # think about update of duration of VehicleChargeLegs
         # LOG.debug(f"update tt an check plan {veh_obj} pax {veh_obj.pax} | at {sim_time} | pax info {self.pax_info}")
         is_feasible = True
+        self._reset_cached_values()
         if len(self.list_plan_stops) == 0:
             self.pax_info = {}
             return is_feasible
@@ -865,6 +1104,10 @@ class VehiclePlan:
             c_pax = init_plan_state["c_pax"].copy()
             c_nr_pax = init_plan_state["c_nr_pax"]
             c_nr_parcels = init_plan_state["c_nr_parcels"]
+            c_dist = init_plan_state["c_dist"]
+            c_dist_excl_le = init_plan_state["c_dist_excl_le"]
+            c_tt = init_plan_state["c_tt"]
+            c_veh_wait = init_plan_state["c_veh_wait"]
             self.pax_info = {}
             for k, v in init_plan_state["pax_info"].items():
                 self.pax_info[k] = v.copy()
@@ -883,23 +1126,33 @@ class VehiclePlan:
             c_pax = {key_translator.get(rq.get_rid_struct(), rq.get_rid_struct()): 1 for rq in veh_obj.pax}
             c_nr_pax = veh_obj.get_nr_pax_without_currently_boarding()  # sum([rq.nr_pax for rq in veh_obj.pax])
             c_nr_parcels = veh_obj.get_nr_parcels_without_currently_boarding()
+            c_dist = 0
+            c_dist_excl_le = None
+            c_tt = 0
+            c_veh_wait = 0
             for rq in veh_obj.pax:
                 # LOG.debug(f"add pax info {rq.get_rid_struct()} : {rq.pu_time}")
                 rid = key_translator.get(rq.get_rid_struct(), rq.get_rid_struct())
                 self.pax_info[rid] = [rq.pu_time]
             #LOG.verbose("init pax {} | {} | {}".format(c_pax, veh_obj.pax, self.pax_info))
         # LOG.debug(f"c_time 1 {c_time}")
+        route_completed = True
         for i in range(start_stop_index, len(self.list_plan_stops)):
             pstop = self.list_plan_stops[i]
         #for i, pstop in enumerate(self.list_plan_stops[start_stop_index:], start=start_stop_index):
             pstop_pos = pstop.get_pos()
+            if c_dist_excl_le is None and pstop.is_locked_end():
+                c_dist_excl_le = c_dist
             if c_pos != pstop_pos:
                 if not is_feasible and not keep_feasible:
                     # LOG.debug(f" -> break because infeasible | is feasible {is_feasible} keep_feasible {keep_feasible}")
+                    route_completed = False
                     break
                 _, tt, tdist = routing_engine.return_travel_costs_1to1(c_pos, pstop_pos)
                 c_pos = pstop_pos
                 c_time += tt
+                c_dist += tdist
+                c_tt += tt
                 # LOG.debug(f"c_time 2 {c_time}")
 
                 c_soc -= veh_obj.compute_soc_consumption(tdist)
@@ -950,6 +1203,8 @@ class VehiclePlan:
 
                 c_time = pstop.get_departure_time(c_time)
                 pstop.set_planned_arrival_and_departure_time(last_c_time, c_time)
+                if c_time > last_c_time:
+                    c_veh_wait += c_time - last_c_time
 
                 if pstop.get_charging_power() > 0:  # TODO # is charging now in waiting included as planned here?
                     c_soc += veh_obj.compute_soc_charging(pstop.get_charging_power(), c_time - last_c_time)
@@ -962,6 +1217,18 @@ class VehiclePlan:
                     break
                 # LOG.debug("LOCK because infeasible {}".format(i))
                 p_stop.set_infeasible_locked(True)
+        self._cached_plan_stops = self.list_plan_stops.copy()
+        self.cached_end_time = self.list_plan_stops[-1].get_planned_arrival_and_departure_time()[0]
+        if route_completed:
+            self._route_start_pos = veh_obj.pos
+            self._route_network_id = id(routing_engine)
+            self._route_tt_version = routing_engine.travel_time_version
+            self._sum_route_distance = c_dist
+            if c_dist_excl_le is None:
+                c_dist_excl_le = c_dist
+            self._sum_route_distance_excl_locked_end = c_dist_excl_le
+            self._sum_route_tt = c_tt
+            self._sum_veh_wait = c_veh_wait
         # LOG.debug(f"is feasible {is_feasible} | pax info {self.pax_info}")
         # LOG.debug("update plan and check tt {}".format(self))
         return is_feasible
@@ -1,9 +1,10 @@
 from __future__ import annotations
 import logging
-import numpy as np
+import math
+from functools import partial
 
 import logging
-from typing import TYPE_CHECKING, Dict, Any, Callable
+from typing import TYPE_CHECKING, Dict, Any, Callable, NamedTuple
 if TYPE_CHECKING:
     from src.fleetctrl.planning.VehiclePlan import VehiclePlan
     from src.fleetctrl.planning.PlanRequest import PlanRequest
@@ -19,6 +20,51 @@ MAX_DISTANCE = 100 * 1000  # 100 km -> to define an assignment reward per reques
 MAX_DELAY = 2 * 60 * 60  # 2 hours -> to define an assignment reward per request
 MAX_BASE_DISTANCE_COST = 100/1000  # 1 dollar per km
 
+# flags of objective terms for ObjectiveConfig
+DIST_TERM = 1  # driven distance
+USER_TIME_TERM = 2  # sum of user times (request time till drop off)
+VEH_DISTANCE_COST = 4  # distance weighted by veh_obj.distance_cost instead of ObjectiveConfig.distance_cost
+IGNORE_LOCKED_END = 8  # distance only until first locked_end plan stop (i.e. reservation stop)
+
+
+class ObjectiveConfig(NamedTuple):
+    """Coefficients of objective functions, which are linear combinations of distance and user time terms."""
+    flags: int
+    distance_cost: float = 1.0
+    vot: float = 1.0
+    assignment_reward: float = 0.0
+
+# -------------------------------------------------------------------------------------------------------------------- #
+# help functions
+# --------------
+def evaluate(cfg:ObjectiveConfig, simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan,
+             rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
+    """This function evaluates objectives, which are defined by an ObjectiveConfig.
+
+    :param cfg: objective configuration (terms and coefficients)
+    :param simulation_time: current simulation time
+    :param veh_obj: simulation vehicle object
+    :param veh_plan: vehicle plan in question
+    :param rq_dict: rq -> Plan request dictionary
+    :param routing_engine: for routing queries
+    :return: objective function value
+    """
+    # empty plan of an idle vehicle: no terms contribute to any of the objectives
+    if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+        return 0.0
+    flags = cfg.flags
+    obj = 0
+    if flags & DIST_TERM:
+        sum_dist = veh_plan.get_route_distance(veh_obj, routing_engine,
+                                       ignore_locked_end=bool(flags & IGNORE_LOCKED_END))
+        if flags & VEH_DISTANCE_COST:
+            obj += sum_dist * veh_obj.distance_cost
+        else:
+            obj += sum_dist * cfg.distance_cost
+    if flags & USER_TIME_TERM:
+        obj += veh_plan.get_sum_user_times(rq_dict) * cfg.vot
+    return obj - len(veh_plan.pax_info) * cfg.assignment_reward
+
 # -------------------------------------------------------------------------------------------------------------------- #
 # main function
 # -------------
@@ -42,32 +88,15 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
     # --------------------------------------
     if func_key == "total_distance":
         assignment_reward_per_rq = MAX_DISTANCE
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
-        def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
-            """This function evaluates the driven distance according to a vehicle plan.
-
-            :param simulation_time: current simulation time
-            :param veh_obj: simulation vehicle object
-            :param veh_plan: vehicle plan in question
-            :param rq_dict: rq -> Plan request dictionary
-            :param routing_engine: for routing queries
-            :return: objective function value
-            """
-            assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
-            sum_dist = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
-            return sum_dist - assignment_reward
+        # evaluates the driven distance according to a vehicle plan
+        control_f = partial(evaluate, ObjectiveConfig(DIST_TERM, assignment_reward=assignment_reward_per_rq))
 
     elif func_key == "total_system_time":
         ignore_repo_stop_wt = vr_control_func_dict.get("irswt", False)
         assignment_reward_per_rq = MAX_DELAY * 10
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
         if not ignore_repo_stop_wt:
             def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
@@ -80,12 +109,11 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
                 :param routing_engine: for routing queries
                 :return: objective function value
                 """
+                if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                    return 0.0
                 assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
                 # end time (for request assignment purposes) defined by arrival at last stop
-                if veh_plan.list_plan_stops:
-                    end_time = veh_plan.list_plan_stops[-1].get_planned_arrival_and_departure_time()[0]
-                else:
-                    end_time = simulation_time
+                end_time = veh_plan.get_end_time(simulation_time)
                 # utility is negative value of end_time - simulation_time
                 return end_time - simulation_time - assignment_reward
         else:
@@ -101,17 +129,18 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
                 :param routing_engine: for routing queries
                 :return: objective function value
                 """
+                if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                    return 0.0
                 assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
                 # end time (for request assignment purposes) defined by arrival at last stop
                 if veh_plan.list_plan_stops:
                     if veh_plan.list_plan_stops[-1].is_locked_end():
                         if len(veh_plan.list_plan_stops) > 1:
-                            prev_end_time = veh_plan.list_plan_stops[-2].get_planned_arrival_and_departure_time()[0]
-                            end_time = prev_end_time + routing_engine.return_travel_costs_1to1(veh_plan.list_plan_stops[-2].get_pos(), veh_plan.list_plan_stops[-1].get_pos())[1]
+                            end_time = veh_plan.get_end_time_no_repo(veh_obj, routing_engine)
                         else:
                             end_time = simulation_time + routing_engine.return_travel_costs_1to1(veh_obj.pos, veh_plan.list_plan_stops[-1].get_pos())[1]   
                     else:
-                        end_time = veh_plan.list_plan_stops[-1].get_planned_arrival_and_departure_time()[0]
+                        end_time = veh_plan.get_end_time(simulation_time)
                 else:
                     end_time = simulation_time
                 # utility is negative value of end_time - simulation_time
@@ -119,32 +148,14 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
 
     elif func_key == "user_times":
         assignment_reward_per_rq = MAX_DELAY
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
-        
-        def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
-            """This function evaluates the total spent time of a vehicle according to a vehicle plan.
+        # evaluates the sum of user times (waiting and in-vehicle time) according to a vehicle plan
+        control_f = partial(evaluate, ObjectiveConfig(USER_TIME_TERM, assignment_reward=assignment_reward_per_rq))
 
-            :param simulation_time: current simulation time
-            :param veh_obj: simulation vehicle object
-            :param veh_plan: vehicle plan in question
-            :param rq_dict: rq -> Plan request dictionary
-            :param routing_engine: for routing queries
-            :return: objective function value
-            """
-            assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
-            # value of time term (treat waiting and in-vehicle time the same)
-            sum_user_times = 0
-            for rid, boarding_info_list in veh_plan.pax_info.items():
-                rq_time = rq_dict[rid].rq_time
-                drop_off_time = boarding_info_list[1]
-                sum_user_times += (drop_off_time - rq_time)
-            # utility is negative value of end_time - simulation_time
-            return sum_user_times  - assignment_reward
-        
     elif func_key == "total_travel_times":
         assignment_reward_per_rq = MAX_DELAY * 10
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
         
         def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
@@ -157,20 +168,16 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
             assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
-            sum_tt = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_tt += routing_engine.return_travel_costs_1to1(last_pos, pos)[1]
-                    last_pos = pos
+            sum_tt = veh_plan.get_route_travel_time(veh_obj, routing_engine)
             return sum_tt - assignment_reward
 
     elif func_key == "system_and_user_time":
         user_weight = vr_control_func_dict["uw"]
         assignment_reward_per_rq = MAX_DELAY * 10
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
         
         def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
@@ -184,18 +191,13 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
             assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
             # value of time term (treat waiting and in-vehicle time the same)
-            sum_user_times = 0
-            for rid, boarding_info_list in veh_plan.pax_info.items():
-                rq_time = rq_dict[rid].rq_time
-                drop_off_time = boarding_info_list[1]
-                sum_user_times += (drop_off_time - rq_time)
+            sum_user_times = veh_plan.get_sum_user_times(rq_dict)
 
-            if veh_plan.list_plan_stops:
-                end_time = veh_plan.list_plan_stops[-1].get_planned_arrival_and_departure_time()[0]
-            else:
-                end_time = simulation_time
+            end_time = veh_plan.get_end_time(simulation_time)
             system_time = end_time - simulation_time
             #print("vid {}-> vids {} | simulation time {} : ctrf: sys time {} | user time {} | both {} | all {}".format(veh_obj.vid, veh_plan.get_dedicated_rid_list(), simulation_time, system_time, sum_user_times, system_time + user_weight*sum_user_times, system_time + user_weight*sum_user_times - assignment_reward))
             return system_time + user_weight*sum_user_times - assignment_reward
@@ -203,37 +205,13 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
     elif func_key == "distance_and_user_times":
         traveler_vot = vr_control_func_dict["vot"]
         assignment_reward_per_rq = MAX_DISTANCE * MAX_BASE_DISTANCE_COST + MAX_DELAY * traveler_vot
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
-
-        def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
-            """This function combines the total driving costs and the value of customer time.
-
-            :param simulation_time: current simulation time
-            :param veh_obj: simulation vehicle object
-            :param veh_plan: vehicle plan in question
-            :param rq_dict: rq -> Plan request dictionary
-            :param routing_engine: for routing queries
-            :return: objective function value
-            """
-            assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
-            # distance term
-            sum_dist = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
-            # value of time term (treat waiting and in-vehicle time the same)
-            sum_user_times = 0
-            for rid, boarding_info_list in veh_plan.pax_info.items():
-                rq_time = rq_dict[rid].rq_time
-                drop_off_time = boarding_info_list[1]
-                sum_user_times += (drop_off_time - rq_time)
-            # vehicle costs are taken from simulation vehicle (cent per meter)
-            # value of travel time is scenario input (cent per second)
-            return sum_dist * veh_obj.distance_cost + sum_user_times * traveler_vot - assignment_reward
+        # combines the total driving costs and the value of customer time (waiting and in-vehicle time the same)
+        # vehicle costs are taken from simulation vehicle (cent per meter)
+        # value of travel time is scenario input (cent per second)
+        control_f = partial(evaluate, ObjectiveConfig(DIST_TERM | VEH_DISTANCE_COST | USER_TIME_TERM, vot=traveler_vot,
+                                                      assignment_reward=assignment_reward_per_rq))
 
     elif func_key == "distance_and_user_times_man":
         traveler_vot = vr_control_func_dict["vot"]
@@ -241,63 +219,81 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
         assignment_reward_per_rq = vr_control_func_dict.get("arw", None)
         if assignment_reward_per_rq is None:
             assignment_reward_per_rq = MAX_DISTANCE * distance_cost + MAX_DELAY * traveler_vot
-            assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+            assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         ignore_reservation_stop = vr_control_func_dict.get("irs", True) # ignore travel distance to reservation stop (last in plan; usually far in the future)
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
         LOG.info(f" -> ignore_reservation_stop: {ignore_reservation_stop}")
         reassignment_penalty = vr_control_func_dict.get("p_reassign", None)  # penalty for reassigning a request
 
-        def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
-            """This function combines the total driving costs and the value of customer time.
+        if reassignment_penalty is None:
+            # combines the total driving costs and the value of customer time (waiting and in-vehicle time the same)
+            flags = DIST_TERM | USER_TIME_TERM
+            if ignore_reservation_stop:
+                flags |= IGNORE_LOCKED_END
+            control_f = partial(evaluate, ObjectiveConfig(flags, distance_cost=distance_cost, vot=traveler_vot,
+                                                          assignment_reward=assignment_reward_per_rq))
+        else:
+            def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
+                """This function combines the total driving costs, the value of customer time and a penalty for reassigning
+                requests to another vehicle.
 
-            :param simulation_time: current simulation time
-            :param veh_obj: simulation vehicle object
-            :param veh_plan: vehicle plan in question
-            :param rq_dict: rq -> Plan request dictionary
-            :param routing_engine: for routing queries
-            :return: objective function value
-            """
-            assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
-            # distance term
-            sum_dist = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                if ps.is_locked_end() and ignore_reservation_stop:
-                    break
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
-            # value of time term (treat waiting and in-vehicle time the same)
-            sum_user_times = 0
-            for rid, boarding_info_list in veh_plan.pax_info.items():
-                rq_time = rq_dict[rid].rq_time
-                drop_off_time = boarding_info_list[1]
-                sum_user_times += (drop_off_time - rq_time)
+                :param simulation_time: current simulation time
+                :param veh_obj: simulation vehicle object
+                :param veh_plan: vehicle plan in question
+                :param rq_dict: rq -> Plan request dictionary
+                :param routing_engine: for routing queries
+                :return: objective function value
+                """
+                if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                    return 0.0
+                assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
+                # distance term
+                sum_dist = veh_plan.get_route_distance(veh_obj, routing_engine, ignore_locked_end=ignore_reservation_stop)
+                # value of time term (treat waiting and in-vehicle time the same)
+                sum_user_times = veh_plan.get_sum_user_times(rq_dict)
                 
-            # reassignment penalty
-            if reassignment_penalty is not None:
+                # reassignment penalty
+                vid = veh_obj.vid
                 for rid in veh_plan.pax_info.keys():
                     offer = rq_dict[rid].get_current_offer()
-                    if offer is not None and offer.get("vid") is not None and offer["vid"] != veh_obj.vid:
-                        LOG.debug(f" -> reassigning request {rid} from {offer['vid']} to {veh_obj.vid} with penalty {reassignment_penalty}")
+                    if offer is not None and offer.get("vid") is not None and offer["vid"] != vid:
+                        LOG.debug(f" -> reassigning request {rid} from {offer['vid']} to {vid} with penalty {reassignment_penalty}")
                         assignment_reward -= reassignment_penalty
-            # vehicle costs are taken from simulation vehicle (cent per meter)
-            # value of travel time is scenario input (cent per second)
-            # LOG.debug(f" -> obj eval: sum_dist {sum_dist} * distance_cost {distance_cost} + sum_user_times {sum_user_times} * traveler_vot {traveler_vot} - assignment_reward {assignment_reward}")
-            return sum_dist * distance_cost + sum_user_times * traveler_vot - assignment_reward
+                # vehicle costs are taken from simulation vehicle (cent per meter)
+                # value of travel time is scenario input (cent per second)
+                # LOG.debug(f" -> obj eval: sum_dist {sum_dist} * distance_cost {distance_cost} + sum_user_times {sum_user_times} * traveler_vot {traveler_vot} - assignment_reward {assignment_reward}")
+                return sum_dist * distance_cost + sum_user_times * traveler_vot - assignment_reward
         
     elif func_key == "distance_and_user_times_man_with_reservation":
         traveler_vot = vr_control_func_dict["vot"]
         distance_cost = vr_control_func_dict["dc"]
         reservation_rq_weight = vr_control_func_dict.get("rrw", 10) # reward factor for assigning not assigned reservation requests
         assignment_reward_per_rq = MAX_DISTANCE * distance_cost + MAX_DELAY * traveler_vot
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         ignore_reservation_stop = vr_control_func_dict.get("irs", True) # ignore travel distance to reservation stop (last in plan; usually far in the future)
         ignore_user_cost_horizon = vr_control_func_dict.get("iuch", None) # ignore user cost horizon for reservation requests
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
         LOG.info(f" -> ignore_reservation_stop: {ignore_reservation_stop}")
         LOG.info(f" -> ignore_user_cost_horizon: {ignore_user_cost_horizon}")
+        reservation_assignment_reward_per_rq = reservation_rq_weight * assignment_reward_per_rq
+
+        # user times are measured from the earliest pick-up time
+        if ignore_user_cost_horizon is None:
+            def sum_user_times_f(simulation_time:float, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest])->float:
+                sum_user_times = 0
+                for rid, boarding_info_list in veh_plan.pax_info.items():
+                    ept = rq_dict[rid].get_o_stop_info()[1]
+                    sum_user_times += (boarding_info_list[1] - ept)
+                return sum_user_times
+        else:
+            def sum_user_times_f(simulation_time:float, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest])->float:
+                sum_user_times = 0
+                for rid, boarding_info_list in veh_plan.pax_info.items():
+                    ept = rq_dict[rid].get_o_stop_info()[1]
+                    if ept - simulation_time > ignore_user_cost_horizon:
+                        continue
+                    sum_user_times += (boarding_info_list[1] - ept)
+                return sum_user_times
 
         def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
             """This function combines the total driving costs and the value of customer time.
@@ -309,32 +305,19 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
-            assignment_reward = 0
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
+            nr_reservation_rqs = 0
             for rid in veh_plan.pax_info.keys():
                 if rq_dict[rid].get_reservation_flag():
-                    assignment_reward += reservation_rq_weight * assignment_reward_per_rq
-                else:
-                    assignment_reward += assignment_reward_per_rq
-                    
+                    nr_reservation_rqs += 1
+            assignment_reward = (len(veh_plan.pax_info) - nr_reservation_rqs) * assignment_reward_per_rq \
+                                + nr_reservation_rqs * reservation_assignment_reward_per_rq
+
             # distance term
-            sum_dist = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                if ps.is_locked_end() and ignore_reservation_stop:
-                    break
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
+            sum_dist = veh_plan.get_route_distance(veh_obj, routing_engine, ignore_locked_end=ignore_reservation_stop)
             # value of time term (treat waiting and in-vehicle time the same)
-            sum_user_times = 0
-            for rid, boarding_info_list in veh_plan.pax_info.items():
-                #rq_time = rq_dict[rid].rq_time
-                ept = rq_dict[rid].get_o_stop_info()[1]
-                if ignore_user_cost_horizon is not None and ept - simulation_time > ignore_user_cost_horizon:
-                    continue
-                drop_off_time = boarding_info_list[1]
-                sum_user_times += (drop_off_time - ept)
+            sum_user_times = sum_user_times_f(simulation_time, veh_plan, rq_dict)
             # vehicle costs are taken from simulation vehicle (cent per meter)
             # value of travel time is scenario input (cent per second)
             # LOG.debug(f" -> obj eval: sum_dist {sum_dist} * distance_cost {distance_cost} + sum_user_times {sum_user_times} * traveler_vot {traveler_vot} - assignment_reward {assignment_reward}")
@@ -355,17 +338,14 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
             assignment_reward = len(veh_plan.pax_info) * LARGE_INT
             fixed_reward = 0
 
             # distance term
-            sum_dist = 0
-            last_pos = veh_obj.pos
+            sum_dist = veh_plan.get_route_distance(veh_obj, routing_engine)
             for ps in veh_plan.list_plan_stops:
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
                 # add fixed reward for number of requests served in the fixed route portion
                 # if ps.direct_earliest_end_time is not None:
                 if ps.is_fixed_stop():
@@ -378,11 +358,7 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
                     #           )
 
             # value of time term (treat waiting and in-vehicle time the same)
-            sum_user_times = 0
-            for rid, boarding_info_list in veh_plan.pax_info.items():
-                rq_time = rq_dict[rid].rq_time
-                drop_off_time = boarding_info_list[1]
-                sum_user_times += (drop_off_time - rq_time)
+            sum_user_times = veh_plan.get_sum_user_times(rq_dict)
             # vehicle costs are taken from simulation vehicle (cent per meter)
             # value of travel time is scenario input (cent per second)
 
@@ -393,7 +369,7 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
     elif func_key == "distance_and_user_times_with_walk":
         traveler_vot = vr_control_func_dict["vot"]
         assignment_reward_per_rq = MAX_DISTANCE * MAX_BASE_DISTANCE_COST + MAX_DELAY * traveler_vot
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
 
         def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
@@ -406,20 +382,17 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
             assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
             # distance term
-            sum_dist = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
+            sum_dist = veh_plan.get_route_distance(veh_obj, routing_engine)
             # value of time term (treat waiting and in-vehicle time the same)
             sum_user_times = 0
             for rid, boarding_info_list in veh_plan.pax_info.items():
-                rq_time = rq_dict[rid].rq_time
-                walking_time_end = rq_dict[rid].walking_time_end    #walking time start allready included in interval rq-time -> drop_off_time
+                prq = rq_dict[rid]
+                rq_time = prq.rq_time
+                walking_time_end = prq.walking_time_end    #walking time start allready included in interval rq-time -> drop_off_time
                 drop_off_time = boarding_info_list[1]
                 sum_user_times += (drop_off_time - rq_time) + walking_time_end
             # vehicle costs are taken from simulation vehicle (cent per meter)
@@ -427,10 +400,9 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             return sum_dist * veh_obj.distance_cost + sum_user_times * traveler_vot - assignment_reward
 
     elif func_key == "distance_and_user_vehicle_times":
-        traveler_vot = vr_control_func_dict["vot"]
         traveler_vot = vr_control_func_dict["vot"]
         assignment_reward_per_rq = MAX_DISTANCE * MAX_BASE_DISTANCE_COST + MAX_DELAY * traveler_vot
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
 
         def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
@@ -443,40 +415,26 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
-            assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
             # distance term
-            sum_dist = 0
-            sum_veh_wait = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                # penalize VehiclePlan if it is not planned through and raise warning
-                arrival_time, departure_time = ps.get_planned_arrival_and_departure_time()
-                pos = ps.get_pos()
-                if arrival_time is None:
-                    assignment_reward = -len(veh_plan.pax_info) * LARGE_INT
-                else:
-                    # compute vehicle stop time if departure is already planned
-                    if departure_time is not None:
-                        veh_wait_time = departure_time - arrival_time
-                        if veh_wait_time > 0:
-                            sum_veh_wait += veh_wait_time
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
+            sum_dist = veh_plan.get_route_distance(veh_obj, routing_engine)
+            distance_cost = veh_obj.distance_cost
+            sum_veh_wait = veh_plan.get_sum_veh_wait()
+            if sum_veh_wait is None:
+                # penalize VehiclePlan if it is not planned through (user times are not available)
+                return sum_dist * distance_cost + len(veh_plan.pax_info) * LARGE_INT
+            assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
             # value of time term (treat waiting and in-vehicle time the same)
-            sum_user_times = 0
-            for rid, boarding_info_list in veh_plan.pax_info.items():
-                rq_time = rq_dict[rid].rq_time
-                drop_off_time = boarding_info_list[1]
-                sum_user_times += (drop_off_time - rq_time)
+            sum_user_times = veh_plan.get_sum_user_times(rq_dict)
             # vehicle costs are taken from simulation vehicle (cent per meter)
             # value of travel time is scenario input (cent per second)
-            return sum_dist * veh_obj.distance_cost + (sum_user_times + sum_veh_wait) * traveler_vot - assignment_reward
+            return sum_dist * distance_cost + (sum_user_times + sum_veh_wait) * traveler_vot - assignment_reward
 
     elif func_key == "sys_time_and_detour_time":
         detour_weight = vr_control_func_dict["dtw"]
         assignment_reward_per_rq = MAX_DELAY * 10
-        assignment_reward_per_rq = 10 ** np.ceil(np.log10(assignment_reward_per_rq))
+        assignment_reward_per_rq = float(10 ** math.ceil(math.log10(assignment_reward_per_rq)))
         LOG.info(f" -> assignment_reward_per_rq for objective function: {assignment_reward_per_rq}")
 
         def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
@@ -491,17 +449,13 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
             assignment_reward = len(veh_plan.pax_info) * assignment_reward_per_rq
             # end time (for request assignment purposes) defined by arrival at last stop
-            if veh_plan.list_plan_stops:
-                end_time = veh_plan.list_plan_stops[-1].get_planned_arrival_and_departure_time()[0]
-            else:
-                end_time = simulation_time
+            end_time = veh_plan.get_end_time(simulation_time)
             sys_time = end_time - simulation_time
-            s_det = 0
-            for rid, boarding_info_list in veh_plan.pax_info.items():
-                det = boarding_info_list[1] - boarding_info_list[0] - rq_dict[rid].init_direct_tt
-                s_det += det
+            s_det = veh_plan.get_sum_detour_times(rq_dict)
             if len(veh_plan.pax_info) > 0:
                 return sys_time + s_det*detour_weight - assignment_reward
             else:
@@ -509,6 +463,12 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
     
     elif func_key == "IRS_study_standard":
         LOG.warning(f"This objective might be deprecated. Please check the implementation.")
+        # assignment rewards of requests that are not picked up yet
+        locked_rq_reward = LARGE_INT*10000
+        # lookup by (prq.status < G_PRQS_LOCKED) for requests that are not locked
+        # TODO # Cplex only allows floats. Therefore the float(LARGE_INT) workaround.
+        #  For some reason LARGE_INT*10000 does not seem to be a problem though...
+        unlocked_rq_rewards = (LARGE_INT*100, float(LARGE_INT))
         def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
             """This function tries to minimize the waiting time of unlocked users.
 
@@ -519,35 +479,35 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
             sum_user_wait_times = 0
             assignment_reward = 0
             sum_dist = 0
             last_pos = veh_obj.pos
+            return_travel_costs_1to1 = routing_engine.return_travel_costs_1to1
             for ps in veh_plan.list_plan_stops:
-                pos = ps.get_pos()
+                pos = ps.pos
                 if pos != last_pos and len(ps.get_list_boarding_rids()):
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
+                    sum_dist += return_travel_costs_1to1(last_pos, pos)[2]
                     last_pos = pos
             for rid, boarding_info_list in veh_plan.pax_info.items():
                 prq = rq_dict[rid]
                 if prq.pu_time is None:
-                    rq_time = rq_dict[rid].rq_time
+                    rq_time = prq.rq_time
                     pick_up_time = boarding_info_list[0]
                     sum_user_wait_times += (pick_up_time - rq_time)
                     if prq.is_locked():
-                        assignment_reward += LARGE_INT*10000
-                    elif prq.status < G_PRQS_LOCKED:
-                        assignment_reward += float(LARGE_INT)
-                        # TODO # Cplex only allows floats. Therefore this workaround.
-                        #  For some reason LARGE_INT*10000 does not seem to be a problem though...
+                        assignment_reward += locked_rq_reward
                     else:
-                        assignment_reward += LARGE_INT*100
+                        assignment_reward += unlocked_rq_rewards[prq.status < G_PRQS_LOCKED]
             # 4 is the empirically found parameter to weigh saved dist against saved waiting time
             return sum_dist + sum_user_wait_times - assignment_reward
 
     elif func_key == "soft_time_windows":
         LOG.warning(f"This objective might be deprecated. Please check the implementation.")
-        soft_tw_rewards = {"locked": LARGE_INT * 1000, "in time window": LARGE_INT + 100}
+        locked_rq_reward = LARGE_INT * 1000
+        in_time_window_rq_reward = LARGE_INT + 100
         def control_f(simulation_time:float, veh_obj:SimulationVehicle, veh_plan:VehiclePlan, rq_dict:Dict[Any,PlanRequest], routing_engine:NetworkBase)->float:
             """This function tries to minimize the waiting time of unlocked users. It penalizes assignments that imply
             pickups outside of the respective requests' time windows.
@@ -559,26 +519,22 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             :param routing_engine: for routing queries
             :return: objective function value
             """
+            if not veh_plan.list_plan_stops and not veh_plan.pax_info:
+                return 0.0
             sum_user_wait_times = 0
             assignment_reward = 0
-            sum_dist = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
+            sum_dist = veh_plan.get_route_distance(veh_obj, routing_engine)
             for rid, boarding_info_list in veh_plan.pax_info.items():
                 prq = rq_dict[rid]
                 if prq.pu_time is None:
-                    rq_time = rq_dict[rid].rq_time
+                    rq_time = prq.rq_time
                     pick_up_time = boarding_info_list[0]
-                    _, t_pu_earliest, t_pu_latest = rq_dict[rid].get_soft_o_stop_info()
                     sum_user_wait_times += (pick_up_time - rq_time)
                     if prq.is_locked():
-                        assignment_reward += soft_tw_rewards["locked"]
-                    elif t_pu_earliest <= pick_up_time <= t_pu_latest:
-                        assignment_reward += soft_tw_rewards["in time window"]
+                        assignment_reward += locked_rq_reward
+                    # soft pick-up time window (see SoftConstraintPlanRequest.get_soft_o_stop_info())
+                    elif prq.ept_soft <= pick_up_time <= prq.lpt_soft:
+                        assignment_reward += in_time_window_rq_reward
                     else:
                         assignment_reward += LARGE_INT
             return sum_dist + sum_user_wait_times - assignment_reward
@@ -606,4 +562,8 @@ def return_pooling_objective_function(vr_control_func_dict:dict)->Callable[[int,
             LOG.error(f" -> veh_plan: {veh_plan}")
             raise e
 
-    return embedded_control_f
+    if LOG.isEnabledFor(logging.DEBUG):
+        return embedded_control_f
+    # without debug logging, the objective is called directly to avoid the additional wrapper call for every
+    # evaluated plan; errors are still raised with their traceback
+    return control_f
@@ -125,6 +125,7 @@ class QuasiVehiclePlan(VehiclePlan):
         tmp_VehiclePlan.utility = self.utility
         tmp_VehiclePlan.pax_info = self.pax_info.copy()
         tmp_VehiclePlan.feasible = True
+        self._copy_cached_values(tmp_VehiclePlan)
         return tmp_VehiclePlan
 
     def return_intermediary_plan_state(self, veh_obj : None, sim_time : int, routing_engine : NetworkBase, stop_index : int):
@@ -36,13 +36,7 @@ def return_parcel_pooling_objective_function(vr_control_func_dict):
             :return: objective function value
             """
             assignment_reward = len(veh_plan.pax_info) * LARGE_INT
-            sum_dist = 0
-            last_pos = veh_obj.pos
-            for ps in veh_plan.list_plan_stops:
-                pos = ps.get_pos()
-                if pos != last_pos:
-                    sum_dist += routing_engine.return_travel_costs_1to1(last_pos, pos)[2]
-                    last_pos = pos
+            sum_dist = veh_plan.get_route_distance(veh_obj, routing_engine)
             return sum_dist - assignment_reward
         
     elif func_key == "total_system_time":
@@ -58,10 +52,7 @@ def return_parcel_pooling_objective_function(vr_control_func_dict):
             """
             assignment_reward = len(veh_plan.pax_info) * LARGE_INT
             # end time (for request assignment purposes) defined by arrival at last stop
-            if veh_plan.list_plan_stops:
-                end_time = veh_plan.list_plan_stops[-1].get_planned_arrival_and_departure_time()[0]
-            else:
-                end_time = simulation_time
+            end_time = veh_plan.get_end_time(simulation_time)
             # utility is negative value of end_time - simulation_time
             return end_time - simulation_time - assignment_reward
         
@@ -107,6 +107,10 @@ class Route:
 
 
 class NetworkBase(metaclass=ABCMeta):
+    # increased each time the travel times of the network change (i.e. in update_network or reset_network);
+    # values computed from travel times can be compared against it to check if they are still valid
+    travel_time_version = 0
+
     # static methods (call to global functions, legacy)
     # -------------------------------------------------
     @staticmethod
@@ -266,6 +266,7 @@ class NetworkBasic(NetworkBase):
         """
         loads new travel time files for scenario_time
         """
+        self.travel_time_version += 1
         self._reset_internal_attributes_after_travel_time_update()
         f = self.travel_time_file_infos[scenario_time]
         if self._tt_infos_from_folder:
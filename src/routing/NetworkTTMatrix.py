@@ -227,6 +227,7 @@ class NetworkTTMatrix(NetworkBase):
                             tt_updated = True
                     if tt_updated is True:
                         LOG.info("update network at {}".format(simulation_time))
+                        self.travel_time_version += 1
                         break
         return tt_updated
     